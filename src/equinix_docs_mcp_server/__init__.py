@@ -1,15 +1,41 @@
 """Package initialization for equinix_docs_mcp_server."""
 
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Equinix Labs"
 __description__ = "Equinix Docs and API specifications MCP Server (experimental)"
 
-from .auth import AuthManager
-from .config import Config
-from .docs import DocsManager
+if TYPE_CHECKING:
+    from .auth import AuthManager
+    from .config import Config
+    from .docs import DocsManager
+
+# Handlers are configured by the CLI entry point; stay silent when imported
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public names are imported on first access so importing one submodule does
+# not pull in httpx, aiofiles and the search client as well
+_LAZY_EXPORTS = {
+    "AuthManager": ".auth",
+    "Config": ".config",
+    "DocsManager": ".docs",
+}
 
 __all__ = [
     "Config",
     "AuthManager",
     "DocsManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported names (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
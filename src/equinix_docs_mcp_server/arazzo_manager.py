@@ -22,7 +22,6 @@ Notes:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,6 +29,8 @@ from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+from .yaml_utils import copy_document
+
 try:
     import requests  # Used for ArazzoRunner HTTP client (ensures remote sourceDescriptions load)
 except Exception:  # pragma: no cover
@@ -116,8 +117,6 @@ class ArazzoManager:
                             spec_path,
                             len(doc["workflows"]),
                         )
-                        # Update content so metadata parser sees normalized version
-                        content = yaml.safe_dump(doc)
                     # Normalize simplified step syntax (id->stepId, operation->operationId, params->parameters)
                     mutated = False
                     for wf in doc.get("workflows", []) or []:
@@ -156,12 +155,12 @@ class ArazzoManager:
                                     st["parameters"] = param_list
                                     mutated = True
                     if mutated:
-                        content = yaml.safe_dump(doc)
                         logger.debug(
                             "Normalized simplified step syntax in %s", spec_path
                         )
                     self._spec_docs[spec_path] = doc
-                self._parse_spec_metadata(content, spec_path)
+                # Metadata is read from the normalized doc; no need to re-parse
+                self._parse_spec_metadata(doc, spec_path)
             except Exception as e:  # pragma: no cover
                 logger.error(f"Failed to parse Arazzo spec {spec_path}: {e}")
 
@@ -585,7 +584,7 @@ class ArazzoManager:
                     for nested in nested_steps:
                         if not isinstance(nested, dict):
                             continue
-                        n_clone = json.loads(json.dumps(nested))  # shallow deep copy
+                        n_clone = copy_document(nested)
                         # Substitute $item tokens in parameters & requestBody
                         params = n_clone.get("parameters", [])
                         for p in params:
@@ -691,8 +690,7 @@ class ArazzoManager:
         text = path.read_text()
         return text
 
-    def _parse_spec_metadata(self, content: str, source: str) -> None:
-        data = yaml.safe_load(content)
+    def _parse_spec_metadata(self, data: Any, source: str) -> None:
         if not isinstance(data, dict):
             logger.warning(f"Arazzo spec {source} not a mapping; skipping")
             return
@@ -9,12 +9,20 @@ import httpx
 from pydantic import BaseModel
 
 from .config import Config
+from .http_client import LazyAsyncClient
 
-# Set up logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30)
+# Error pages can be large HTML/JSON; keep logged response bodies bounded
+LOG_BODY_LIMIT = 1024
+
+
+def truncate_for_log(body: str) -> str:
+    """Shorten a response body to LOG_BODY_LIMIT characters for logging."""
+    if len(body) <= LOG_BODY_LIMIT:
+        return body
+    return body[:LOG_BODY_LIMIT] + "..."
 
 
 class AuthManager:
@@ -24,6 +32,8 @@ class AuthManager:
         """Initialize with configuration."""
         self.config = config
         self._token_cache: Dict[str, str] = {}
+        # Shared client so repeated token requests reuse pooled connections
+        self._http = LazyAsyncClient(limits=_HTTP_LIMITS)
 
         # Get credentials from environment
         self.client_id = os.getenv("EQUINIX_CLIENT_ID")
@@ -40,6 +50,10 @@ class AuthManager:
         if self.client_secret:
             logger.info(f"  - CLIENT_SECRET length: {len(self.client_secret)}")
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+
     async def get_auth_header(self, service_name: str) -> Dict[str, str]:
         """Get authentication header for a service."""
         logger.debug(f"Getting auth header for service: {service_name}")
@@ -134,36 +148,42 @@ class AuthManager:
             f"Token request data: {{'grant_type': 'client_credentials', 'client_id': '{self.client_id}', 'client_secret': '[REDACTED]'}}"
         )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.debug("Sending token request...")
-                response = await client.post(token_url, headers=headers, json=data)
+        try:
+            logger.debug("Sending token request...")
+            response = await self._http.client.post(
+                token_url, headers=headers, json=data
+            )
 
-                logger.debug(f"Token response status: {response.status_code}")
-                logger.debug(f"Token response headers: {dict(response.headers)}")
+            logger.debug(f"Token response status: {response.status_code}")
+            if logger.isEnabledFor(logging.DEBUG):
+                # Only the headers useful for diagnosing token failures
+                logged_headers = {
+                    k: response.headers[k]
+                    for k in ("content-type", "www-authenticate", "x-request-id")
+                    if k in response.headers
+                }
+                logger.debug(f"Token response headers: {logged_headers}")
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"Token request failed with status {response.status_code}"
-                    )
-                    logger.error(f"Response body: {response.text}")
+            if response.status_code != 200:
+                logger.error(f"Token request failed with status {response.status_code}")
+                logger.error(f"Response body: {truncate_for_log(response.text)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                token_data = response.json()
-                logger.debug(f"Token response keys: {list(token_data.keys())}")
+            token_data = response.json()
+            logger.debug(f"Token response keys: {list(token_data.keys())}")
 
-                if "access_token" not in token_data:
-                    logger.error(f"No access_token in response: {token_data}")
-                    raise ValueError("No access_token in response")
+            if "access_token" not in token_data:
+                logger.error(f"No access_token in response: {token_data}")
+                raise ValueError("No access_token in response")
 
-                access_token = token_data["access_token"]
-                logger.info("Successfully obtained access token from Equinix")
-                return access_token
+            access_token = token_data["access_token"]
+            logger.info("Successfully obtained access token from Equinix")
+            return access_token
 
-            except Exception as e:
-                logger.error(f"Error getting access token: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Error getting access token: {e}")
+            raise
 
     def clear_token_cache(self) -> None:
         """Clear the token cache."""
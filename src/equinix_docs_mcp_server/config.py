@@ -6,12 +6,25 @@ multiple spec sources (URL and an optional overlay) under a single API
 namespace.
 """
 
+import functools
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 from pydantic import BaseModel, Field
 
+from .yaml_utils import FastSafeLoader, copy_document
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_data(resolved_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML config file, keyed on mtime and size so edits are picked up.
+
+    Size catches rewrites that land within the filesystem's mtime resolution.
+    """
+    with open(resolved_path, "r") as f:
+        return yaml.load(f, Loader=FastSafeLoader)
+
 
 class SpecSource(BaseModel):
     """Single spec source (URL + optional overlay)."""
@@ -103,8 +116,11 @@ class Config(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(path, "r") as f:
-            config_data = yaml.safe_load(f)
+        # Parsed YAML is cached per file; copy it since the dict is mutated below
+        stat = path.stat()
+        config_data = copy_document(
+            _read_config_data(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
 
         # Convert API configs to APIConfig objects
         if "apis" in config_data:
@@ -1,17 +1,119 @@
 """Documentation management using Equinix sitemap."""
 
+import asyncio
+import functools
 import json
+import os
+import string
+import sys
+import time
 import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import aiofiles
 import httpx
 
 from .config import Config
+from .http_client import LazyAsyncClient
 from .lunr_search.search_client import Client as SearchClient
 
+try:  # Optional; faster (de)serialization of the parsed sitemap sidecar
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_SITEMAP_URL_TAG = f"{_SITEMAP_NS}url"
+_SITEMAP_FIELDS = {
+    f"{_SITEMAP_NS}{name}": name
+    for name in ("loc", "lastmod", "changefreq", "priority")
+}
+_SITEMAP_CHUNK_SIZE = 64 * 1024
+# Bump when the shape of parsed sitemap entries changes
+_PARSED_SITEMAP_VERSION = 3
+# Entry fields the search and listing code reads from a loaded sidecar
+_SIDECAR_FIELDS = ("url", "title", "category", "lastmod")
+
+_HTTP_TIMEOUT = 30.0
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30)
+
+# Fetched markdown is kept briefly so repeated lookups skip the network
+_DOC_CACHE_SIZE = 512
+_DOC_CACHE_TTL = 120.0
+# Upper bound on concurrent requests made by fetch_docs
+_FETCH_CONCURRENCY = 16
+
+_TITLE_SEPARATORS = str.maketrans("-_", "  ")
+
+
+@functools.lru_cache(maxsize=65536)
+def _title_from_url(url: str) -> str:
+    """Extract a human-readable title from a URL."""
+    # Last non-empty path segment, without building the full parts list
+    title = urlparse(url).path.rstrip("/").rpartition("/")[2]
+
+    if not title:
+        return "Home"
+
+    # Dashes/underscores become spaces, then each word is capitalized
+    return string.capwords(title.translate(_TITLE_SEPARATORS))
+
+
+@functools.lru_cache(maxsize=65536)
+def _category_for_url(url: str) -> str:
+    """Categorize a URL based on its path."""
+    path = urlparse(url).path.lower()
+
+    if "/api-catalog/" in path:
+        return "API"
+    elif "/metal" in path:
+        return "Metal"
+    elif "/fabric" in path:
+        return "Fabric"
+    elif "/network-edge" in path:
+        return "Network Edge"
+    elif "/billing" in path:
+        return "Billing"
+    elif "/quickstart" in path or "/getting-started" in path:
+        return "Getting Started"
+    elif "/tutorials" in path or "/guides" in path:
+        return "Tutorials"
+    elif "/reference" in path:
+        return "Reference"
+    else:
+        return "General"
+
+
+def _search_keys(doc: Dict[str, str]) -> Tuple[str, str, str, str]:
+    """Return lowercase title, category, URL and their joined text.
+
+    Computed once per entry when the sitemap is set, so searches do not
+    lowercase every document on every query.
+    """
+    title = doc["title"].lower()
+    category = doc["category"].lower()
+    url = doc["url"].lower()
+    return title, category, url, f"{title} {category} {url}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _markdown_url(url: str) -> str:
+    """Normalize a docs URL or path to the full URL of its markdown version."""
+    # Normalize the URL to ensure it ends with .md
+    if not url.endswith(".md"):
+        # Remove trailing slash if present
+        url = url.rstrip("/")
+        # Add .md extension
+        url = f"{url}.md"
+
+    # Ensure we have a full URL
+    if not url.startswith("http"):
+        url = f"https://docs.equinix.com/{url.lstrip('/')}"
+    return url
+
 
 class DocsManager:
     """Manages Equinix documentation discovery and search."""
@@ -19,94 +121,129 @@ class DocsManager:
     def __init__(self, config: Config):
         """Initialize with configuration."""
         self.config = config
-        self.sitemap_cache: List[Dict[str, str]] = []
+        self._sitemap_cache: List[Dict[str, str]] = []
+        # Lowercase search keys, one per sitemap_cache entry
+        self._search_index: List[Tuple[str, str, str, str]] = []
+        self._http = LazyAsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+        # Category counts for the sitemap_cache list they were computed from
+        self._category_counts: Counter = Counter()
+        self._category_counts_source: Optional[List[Dict[str, str]]] = None
+        # Normalized .md URL -> (fetched at, markdown), least recently used first
+        self._doc_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._fetch_sem = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+    @property
+    def sitemap_cache(self) -> List[Dict[str, str]]:
+        """Parsed sitemap entries.
+
+        Assign a new list rather than editing entries in place, so the
+        search keys are rebuilt.
+        """
+        return self._sitemap_cache
 
-    async def update_sitemap(self) -> None:
-        """Update the sitemap cache from the remote sitemap."""
-        sitemap_url = self.config.docs.sitemap_url
+    @sitemap_cache.setter
+    def sitemap_cache(self, entries: List[Dict[str, str]]) -> None:
+        self._sitemap_cache = entries
+        self._search_index = [_search_keys(doc) for doc in entries]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(sitemap_url)
-            response.raise_for_status()
+    def invalidate(self) -> None:
+        """Drop cached document content."""
+        self._doc_cache.clear()
 
-            # Save to cache file
-            cache_path = Path(self.config.docs.cache_path)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
 
-            async with aiofiles.open(cache_path, "w") as f:
-                await f.write(response.text)
+    async def update_sitemap(self) -> None:
+        """Update the sitemap cache from the remote sitemap."""
+        sitemap_url = self.config.docs.sitemap_url
 
-            # Parse the sitemap
-            await self._parse_sitemap(response.text)
+        response = await self._http.client.get(sitemap_url)
+        response.raise_for_status()
 
-    async def _parse_sitemap(self, sitemap_xml: str) -> None:
-        """Parse the sitemap XML and extract URL information."""
-        root = ET.fromstring(sitemap_xml)
+        # Save to cache file
+        cache_path = Path(self.config.docs.cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Handle namespace
-        namespace = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+        async with aiofiles.open(cache_path, "w") as f:
+            await f.write(response.text)
 
-        self.sitemap_cache = []
+        # Parse the sitemap
+        self._parse_sitemap(response.text)
+        await self._save_parsed_sitemap(cache_path)
+        self.invalidate()
 
-        for url_elem in root.findall("ns:url", namespace):
-            loc = url_elem.find("ns:loc", namespace)
-            lastmod = url_elem.find("ns:lastmod", namespace)
-            changefreq = url_elem.find("ns:changefreq", namespace)
-            priority = url_elem.find("ns:priority", namespace)
+    def _parse_sitemap(self, sitemap_xml: str) -> None:
+        """Parse the sitemap XML and extract URL information.
 
-            if loc is not None:
-                url_info = {
-                    "url": loc.text or "",
-                    "lastmod": lastmod.text if lastmod is not None else "",
-                    "changefreq": changefreq.text if changefreq is not None else "",
-                    "priority": priority.text if priority is not None else "",
-                    "title": self._extract_title_from_url(loc.text or ""),
-                    "category": self._categorize_url(loc.text or ""),
-                }
-                # Ensure all values are strings for type safety
-                url_info_safe = {
-                    k: v if v is not None else "" for k, v in url_info.items()
+        The XML is fed to a pull parser in chunks and finished <url> elements
+        are dropped from the tree as they are read, so large sitemaps are
+        never held in memory as a full element tree.
+        """
+        parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
+        entries: List[Dict[str, str]] = []
+        root: Optional[ET.Element] = None
+
+        for offset in range(0, len(sitemap_xml), _SITEMAP_CHUNK_SIZE):
+            parser.feed(sitemap_xml[offset : offset + _SITEMAP_CHUNK_SIZE])
+            root = self._collect_sitemap_urls(parser, root, entries)
+        parser.close()
+        self._collect_sitemap_urls(parser, root, entries)
+        self.sitemap_cache = entries
+
+    def _collect_sitemap_urls(
+        self,
+        parser: ET.XMLPullParser,
+        root: Optional[ET.Element],
+        entries: List[Dict[str, str]],
+    ) -> Optional[ET.Element]:
+        """Append entries for <url> elements completed so far; return the root."""
+        for item in parser.read_events():
+            # Only start/end events are requested; both carry an Element
+            if len(item) != 2:
+                continue
+            event, elem = item
+            if not isinstance(elem, ET.Element):
+                continue
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            if elem.tag != _SITEMAP_URL_TAG:
+                continue
+
+            fields: Dict[str, str] = {}
+            for child in elem:
+                name = _SITEMAP_FIELDS.get(child.tag)
+                # First occurrence wins, like Element.find()
+                if name and name not in fields:
+                    fields[name] = child.text or ""
+
+            if "loc" in fields:
+                loc = fields["loc"]
+                entry = {
+                    "url": loc,
+                    "lastmod": fields.get("lastmod", ""),
+                    "changefreq": fields.get("changefreq", ""),
+                    "priority": fields.get("priority", ""),
+                    "title": self._extract_title_from_url(loc),
+                    "category": self._categorize_url(loc),
                 }
-                self.sitemap_cache.append(url_info_safe)
+                entries.append(entry)
+
+        # Completed <url> elements have been read; detach them from the tree.
+        # An element still being parsed stays referenced by the parser.
+        if root is not None:
+            root.clear()
+        return root
 
     def _extract_title_from_url(self, url: str) -> str:
         """Extract a human-readable title from a URL."""
-        parsed = urlparse(url)
-        path_parts = [part for part in parsed.path.split("/") if part]
-
-        if not path_parts:
-            return "Home"
-
-        # Take the last meaningful part and clean it up
-        title = path_parts[-1]
-        title = title.replace("-", " ").replace("_", " ")
-        title = " ".join(word.capitalize() for word in title.split())
-
-        return title
+        return _title_from_url(url)
 
     def _categorize_url(self, url: str) -> str:
         """Categorize a URL based on its path."""
-        parsed = urlparse(url)
-        path = parsed.path.lower()
-
-        if "/api-catalog/" in path:
-            return "API"
-        elif "/metal" in path:
-            return "Metal"
-        elif "/fabric" in path:
-            return "Fabric"
-        elif "/network-edge" in path:
-            return "Network Edge"
-        elif "/billing" in path:
-            return "Billing"
-        elif "/quickstart" in path or "/getting-started" in path:
-            return "Getting Started"
-        elif "/tutorials" in path or "/guides" in path:
-            return "Tutorials"
-        elif "/reference" in path:
-            return "Reference"
-        else:
-            return "General"
+        return _category_for_url(url)
 
     async def list_docs(self, filter_term: Optional[str] = None) -> str:
         """List documentation with optional filtering."""
@@ -123,25 +260,25 @@ class DocsManager:
             ]
 
             if filter_words:
+                # Precompute each word's singular/plural variant once, not per doc
+                word_variants = [
+                    (word, word[:-1] if word.endswith("s") else f"{word}s")
+                    for word in filter_words
+                ]
+
                 # Score documents based on how many filter words they contain
                 scored_docs = []
-                for doc in self.sitemap_cache:
-                    doc_text = f"{doc['title']} {doc['category']} {doc['url']}".lower()
+                for doc, keys in zip(self.sitemap_cache, self._search_index):
+                    doc_text = keys[3]
                     score = 0.0
 
                     # Count how many filter words appear in the document
-                    for word in filter_words:
-                        word_lower = word.lower()
-                        if word_lower in doc_text:
+                    for word, variant in word_variants:
+                        if word in doc_text:
                             score += 1.0
                         # Also check for common word variations (handle singular/plural)
-                        elif word_lower.endswith("s") and word_lower[:-1] in doc_text:
-                            score += 0.8  # Slightly lower score for stem matches
-                        elif (
-                            not word_lower.endswith("s")
-                            and f"{word_lower}s" in doc_text
-                        ):
-                            score += 0.8  # Handle plural forms
+                        elif variant in doc_text:
+                            score += 0.8  # Slightly lower score for stem/plural matches
 
                     # Bonus points for exact phrase matches
                     if filter_term in doc_text:
@@ -192,31 +329,33 @@ class DocsManager:
             await self._load_cached_sitemap()
 
         query = query.lower()
+        query_words = query.split()
 
         # Score documents based on relevance
         scored_docs = []
 
-        for doc in self.sitemap_cache:
+        for doc, (title, category, url, _) in zip(
+            self.sitemap_cache, self._search_index
+        ):
             score = 0.0
 
             # Title matches are most important
-            if query in doc["title"].lower():
+            if query in title:
                 score += 10
 
             # Category matches
-            if query in doc["category"].lower():
+            if query in category:
                 score += 5
 
             # URL matches
-            if query in doc["url"].lower():
+            if query in url:
                 score += 3
 
             # Keyword scoring
-            query_words = query.split()
             for word in query_words:
-                if word in doc["title"].lower():
+                if word in title:
                     score += 2
-                if word in doc["category"].lower():
+                if word in category:
                     score += 1
 
             if score > 0:
@@ -252,20 +391,15 @@ class DocsManager:
         # Check if we need to fetch the search index
         if not cache_file.exists():
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(search_index_url)
-                    response.raise_for_status()
-
-                    # Save to cache
-                    async with aiofiles.open(cache_file, "w") as f:
-                        await f.write(response.text)
+                await self._download_to_file(search_index_url, cache_file)
             except Exception as e:
                 return f"Error fetching search index: {str(e)}"
 
         # Initialize search client with cached file
         try:
             search_client = SearchClient(str(cache_file))
-            search_client.load()
+            # Decoding a multi-MB index would otherwise stall the event loop
+            await asyncio.to_thread(search_client.load)
 
             # Perform search
             results = search_client.search(query, limit=limit)
@@ -292,18 +426,93 @@ class DocsManager:
         except Exception as e:
             return f"Error searching documentation: {str(e)}"
 
+    async def _download_to_file(self, url: str, path: Path) -> None:
+        """Stream a URL to disk, replacing the file only once it is complete."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            async with self._http.client.stream("GET", url) as response:
+                response.raise_for_status()
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        await f.write(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            # Leftover only when the download failed part way
+            if tmp_path.exists():
+                tmp_path.unlink()
+
     async def _load_cached_sitemap(self) -> None:
         """Load sitemap from cache file if available."""
         cache_path = Path(self.config.docs.cache_path)
 
         if cache_path.exists():
+            if await self._load_parsed_sitemap(cache_path):
+                return
             async with aiofiles.open(cache_path, "r") as f:
                 content = await f.read()
-                await self._parse_sitemap(content)
+                self._parse_sitemap(content)
+            await self._save_parsed_sitemap(cache_path)
         else:
             # If no cache, update from remote
             await self.update_sitemap()
 
+    def _parsed_sitemap_path(self, cache_path: Path) -> Path:
+        """Path of the JSON sidecar holding the parsed form of a sitemap cache."""
+        return cache_path.with_name(f"{cache_path.name}.json")
+
+    def _sitemap_source_key(self, cache_path: Path) -> List[Any]:
+        """Identify the cached sitemap XML the sidecar was built from."""
+        stat = cache_path.stat()
+        return [_PARSED_SITEMAP_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    async def _load_parsed_sitemap(self, cache_path: Path) -> bool:
+        """Load entries from the JSON sidecar if it matches the cached XML."""
+        parsed_path = self._parsed_sitemap_path(cache_path)
+        if not parsed_path.exists():
+            return False
+        try:
+            async with aiofiles.open(parsed_path, "rb") as f:
+                raw = await f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("source") != (
+            self._sitemap_source_key(cache_path)
+        ):
+            return False
+        entries = data.get("entries")
+        if not isinstance(entries, list) or not all(
+            isinstance(entry, dict)
+            and all(isinstance(entry.get(name), str) for name in _SIDECAR_FIELDS)
+            for entry in entries
+        ):
+            # Malformed sidecar; fall back to parsing the XML
+            return False
+        # Decoding gives every entry its own copy of the category string;
+        # share the interned one as freshly parsed entries do
+        for entry in entries:
+            entry["category"] = sys.intern(entry["category"])
+        self.sitemap_cache = entries
+        return True
+
+    async def _save_parsed_sitemap(self, cache_path: Path) -> None:
+        """Write parsed entries next to the XML cache so restarts skip parsing."""
+        parsed_path = self._parsed_sitemap_path(cache_path)
+        tmp_path = parsed_path.with_name(f"{parsed_path.name}.tmp")
+        data = {
+            "source": self._sitemap_source_key(cache_path),
+            "entries": self.sitemap_cache,
+        }
+        raw = orjson.dumps(data) if orjson else json.dumps(data).encode()
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(raw)
+            # Atomic swap so a concurrent reader never sees a partial file
+            os.replace(tmp_path, parsed_path)
+        except OSError:
+            # The sidecar is only an optimization; the XML cache is authoritative
+            pass
+
     async def fetch_doc(self, url: str) -> str:
         """Fetch the markdown content of a documentation page.
 
@@ -314,25 +523,18 @@ class DocsManager:
         Returns:
             The markdown content of the page, or an error message if fetch fails.
         """
-        # Normalize the URL to ensure it ends with .md
-        if not url.endswith(".md"):
-            # Remove trailing slash if present
-            url = url.rstrip("/")
-            # Add .md extension
-            url = f"{url}.md"
+        url = _markdown_url(url)
 
-        # Ensure we have a full URL
-        if not url.startswith("http"):
-            url = f"https://docs.equinix.com/{url.lstrip('/')}"
+        cached = self._doc_cache.get(url)
+        if cached is not None:
+            fetched_at, content = cached
+            if time.monotonic() - fetched_at < _DOC_CACHE_TTL:
+                self._doc_cache.move_to_end(url)
+                return content
+            del self._doc_cache[url]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=30.0)
-                response.raise_for_status()
-
-                # Return the markdown content
-                return response.text
-
+            content = await self._fetch_doc_uncached(url)
         except httpx.HTTPStatusError as e:
             return f"Error fetching document: HTTP {e.response.status_code} - {url}\n\nThe document may not be available in markdown format."
         except httpx.RequestError as e:
@@ -340,16 +542,46 @@ class DocsManager:
         except Exception as e:
             return f"Unexpected error fetching document: {str(e)}\n\nURL: {url}"
 
+        # Only successful fetches are cached so errors are retried
+        self._doc_cache[url] = (time.monotonic(), content)
+        if len(self._doc_cache) > _DOC_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+        return content
+
+    async def fetch_docs(self, urls: List[str]) -> List[str]:
+        """Fetch several documentation pages concurrently.
+
+        Results are returned in the order of ``urls``; each item is the page
+        content or the error message fetch_doc would return for it.
+        """
+        return list(await asyncio.gather(*(self._sem_fetch(url) for url in urls)))
+
+    async def _sem_fetch(self, url: str) -> str:
+        """fetch_doc, bounded by the shared concurrency limit."""
+        async with self._fetch_sem:
+            return await self.fetch_doc(url)
+
+    async def _fetch_doc_uncached(self, url: str) -> str:
+        """Fetch the markdown for an already normalized .md URL."""
+        response = await self._http.client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    def _get_category_counts(self) -> Counter:
+        """Count documents per category, reusing the counts until the cache changes."""
+        if self._category_counts_source is not self.sitemap_cache:
+            self._category_counts = Counter(
+                doc["category"] for doc in self.sitemap_cache
+            )
+            self._category_counts_source = self.sitemap_cache
+        return self._category_counts
+
     async def get_docs_summary(self) -> str:
         """Get a summary of available documentation."""
         if not self.sitemap_cache:
             await self._load_cached_sitemap()
 
-        # Count by category
-        categories: Dict[str, int] = {}
-        for doc in self.sitemap_cache:
-            category = doc["category"]
-            categories[category] = categories.get(category, 0) + 1
+        categories = self._get_category_counts()
 
         result = ["# Equinix Documentation Summary\n"]
         result.append(f"Total documents: {len(self.sitemap_cache)}\n")
@@ -358,8 +590,10 @@ class DocsManager:
         for category, count in sorted(categories.items()):
             result.append(f"- **{category}**: {count} documents")
 
-        result.append(
-            f"\nLast updated: {Path(self.config.docs.cache_path).stat().st_mtime if Path(self.config.docs.cache_path).exists() else 'Never'}"
-        )
+        try:
+            last_updated: Any = Path(self.config.docs.cache_path).stat().st_mtime
+        except OSError:
+            last_updated = "Never"
+        result.append(f"\nLast updated: {last_updated}")
 
         return "\n".join(result)
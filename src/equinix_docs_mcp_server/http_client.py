@@ -0,0 +1,31 @@
+"""Shared HTTP client helper for the Equinix MCP Server."""
+
+from typing import Any, Optional
+
+import httpx
+
+
+class LazyAsyncClient:
+    """An httpx.AsyncClient created on first use and released by aclose().
+
+    Managers that only sometimes make requests hold one of these so they
+    pay for connection pool and SSL setup only when a request is made.
+    """
+
+    def __init__(self, **client_kwargs: Any) -> None:
+        """Store the keyword arguments for the client to be created."""
+        self._client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first access."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_kwargs)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,11 +1,12 @@
 import json
 import re
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
-try:
-    import requests  # type: ignore
-except Exception:
-    requests = None
+try:  # Optional; decodes large indexes several times faster than json
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 class SearchDocument:
@@ -128,8 +129,12 @@ class SearchIndex:
         except Exception:
             # some queries may not be accepted by python-lunr; fall back to empty
             return []
-        refs = [str(h.get("ref") or h.get("id") or h.get("_id")) for h in hits][:limit]
-        return [d for d in self.documents if str(d.i) in set(refs)]
+        # Only the first `limit` hits matter; build the lookup set once
+        refs = {
+            str(h.get("ref") or h.get("id") or h.get("_id"))
+            for h in islice(hits, limit)
+        }
+        return [d for d in self.documents if str(d.i) in refs]
 
 
 def tokenize(text: str, language: Optional[List[str]] = None) -> List[str]:
@@ -163,14 +168,19 @@ class Client:
     def load(self) -> None:
         # Accept either a URL or file path. If it's a URL, fetch; else read local file
         if self.url.startswith("http://") or self.url.startswith("https://"):
-            if requests is None:
+            # Imported lazily: the docs server only loads cached local indexes,
+            # so importing requests at module load is pure startup cost
+            try:
+                import requests  # type: ignore
+            except Exception:
                 raise RuntimeError("requests package not available to fetch URL")
             r = requests.get(self.url)
             r.raise_for_status()
             payload = r.json()
         else:
-            with open(self.url, "r", encoding="utf8") as fh:
-                payload = json.load(fh)
+            with open(self.url, "rb") as fh:
+                raw = fh.read()
+            payload = orjson.loads(raw) if orjson else json.loads(raw)
 
         # payload is an array of serialized indexes (one per type)
         self.indexes = []
@@ -1,16 +1,18 @@
 """Main entry point for the Equinix MCP Server."""
 
 import asyncio
+import json
 import logging
 import os
 from typing import Any, Dict, Optional, Union
 
 import click
 import httpx
+import yaml
 from fastmcp import FastMCP
 
 from .arazzo_manager import ArazzoManager
-from .auth import AuthManager
+from .auth import AuthManager, truncate_for_log
 from .config import Config
 from .docs import DocsManager
 from .response_formatter import ResponseFormatter
@@ -32,6 +34,7 @@ def _configure_logging(log_level: str):
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
 class AuthenticatedClient:
@@ -131,22 +134,24 @@ class AuthenticatedClient:
 
             if response.status_code >= 400:
                 logger.error(f"Request failed with status {response.status_code}")
-                logger.error(f"Response body: {response.text}")
+                logger.error(f"Response body: {truncate_for_log(response.text)}")
 
                 # Add specific logging for authentication-related errors
                 if response.status_code == 401:
-                    logger.error("🔑 Authentication failed! Possible causes:")
-                    logger.error("   - Token expired (check token_timeout)")
-                    logger.error("   - Invalid credentials")
-                    logger.error("   - Incorrect auth type for service")
-                    logger.error("   - Service requires different authentication")
+                    logger.error(
+                        "🔑 Authentication failed! Possible causes:\n"
+                        "   - Token expired (check token_timeout)\n"
+                        "   - Invalid credentials\n"
+                        "   - Incorrect auth type for service\n"
+                        "   - Service requires different authentication"
+                    )
                 elif response.status_code == 403:
-                    logger.error("🚫 Authorization failed! Possible causes:")
-                    logger.error("   - Account lacks permissions for this resource")
                     logger.error(
-                        "   - Service/endpoint requires additional permissions"
+                        "🚫 Authorization failed! Possible causes:\n"
+                        "   - Account lacks permissions for this resource\n"
+                        "   - Service/endpoint requires additional permissions\n"
+                        "   - API key scope limitations"
                     )
-                    logger.error("   - API key scope limitations")
 
             return response
         except Exception as e:
@@ -211,12 +216,29 @@ class EquinixMCPServer:
         self.response_formatter = ResponseFormatter(self.config)
         self.arazzo_manager = ArazzoManager(self.config, auth_manager=self.auth_manager)
         self.mcp: Optional[Any] = None  # Will be initialized in initialize()
+        self._init_task: Optional["asyncio.Task[None]"] = None
 
     async def initialize(self, force_update_specs: bool = False) -> None:
-        """Initialize the server components using FastMCP's OpenAPI integration."""
-        # Enable experimental OpenAPI parser
-        import os
+        """Initialize the server components using FastMCP's OpenAPI integration.
+
+        Concurrent and repeated calls share one initialization; a forced spec
+        update after it has finished, or a retry after a failure, starts anew.
+        """
+        task = self._init_task
+        if task is None or (task.done() and force_update_specs):
+            task = asyncio.create_task(self._initialize(force_update_specs))
+            self._init_task = task
+        try:
+            # Shielded so one cancelled caller does not abort the shared work
+            await asyncio.shield(task)
+        except Exception:
+            if self._init_task is task and task.done():
+                self._init_task = None
+            raise
 
+    async def _initialize(self, force_update_specs: bool) -> None:
+        """Fetch and merge specs, then build the FastMCP server and its tools."""
+        # Enable experimental OpenAPI parser
         os.environ["FASTMCP_EXPERIMENTAL_ENABLE_NEW_OPENAPI_PARSER"] = "true"
 
         # Load and merge API specs - only update if forced or no cached specs exist
@@ -275,6 +297,12 @@ class EquinixMCPServer:
         """Apply tool transformations for formatting and transfer tools to main instance."""
         from fastmcp.tools import Tool
         from fastmcp.tools.tool_transform import forward
+        from mcp.types import TextContent
+
+        try:
+            from fastmcp.tools.tool import ToolResult
+        except ImportError:  # newer fastmcp only exports it from the package
+            from fastmcp.tools import ToolResult  # type: ignore
 
         if not self.mcp:
             return
@@ -316,16 +344,19 @@ class EquinixMCPServer:
                         # Call the original tool
                         result = await forward(**kwargs)
                         logger.debug(f"Forward result type: {type(result)}")
-                        logger.debug(f"Forward result attributes: {dir(result)}")
 
-                        if hasattr(result, "content") and result.content:
-                            logger.debug(
-                                f"Forward result has content with {len(result.content)} items"
-                            )
-                            for i, item in enumerate(result.content):
+                        # dir() listings are costly; only build them when DEBUG is on
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Forward result attributes: {dir(result)}")
+
+                            if hasattr(result, "content") and result.content:
                                 logger.debug(
-                                    f"Content item {i}: type={type(item)}, attributes={dir(item)}"
+                                    f"Forward result has content with {len(result.content)} items"
                                 )
+                                for i, item in enumerate(result.content):
+                                    logger.debug(
+                                        f"Content item {i}: type={type(item)}, attributes={dir(item)}"
+                                    )
 
                         if hasattr(result, "structured_content"):
                             logger.debug(
@@ -355,8 +386,6 @@ class EquinixMCPServer:
                                         logger.debug(
                                             f"Found text content in item {i}: {len(text_content) if text_content else 0} chars"
                                         )
-                                        import json
-
                                         actual_data = json.loads(text_content)
                                         logger.debug(
                                             f"Parsed JSON from TextContent for {operation_id}"
@@ -372,8 +401,11 @@ class EquinixMCPServer:
                             logger.error(
                                 f"❌ Could not extract data from {operation_id} result, returning as-is"
                             )
+                            # Probe the fields extraction relies on instead of dir()
                             logger.error(
-                                f"Result type: {type(result)}, attributes: {[attr for attr in dir(result) if not attr.startswith('_')]}"
+                                f"Result type: {type(result)}, "
+                                f"has content: {bool(getattr(result, 'content', None))}, "
+                                f"has structured_content: {getattr(result, 'structured_content', None) is not None}"
                             )
                             return result
 
@@ -383,13 +415,10 @@ class EquinixMCPServer:
                             formatted_result = self.response_formatter.format_response(
                                 operation_id, actual_data
                             )
-                            logger.debug(
-                                f"JQ formatting returned: {type(formatted_result)} - {repr(formatted_result)[:200] if formatted_result else 'None'}"
-                            )
-
-                            # Import the required types
-                            from fastmcp.tools.tool import ToolResult
-                            from mcp.types import TextContent
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    f"JQ formatting returned: {type(formatted_result)} - {repr(formatted_result)[:200] if formatted_result else 'None'}"
+                                )
 
                             # Ensure we have a valid string for the TextContent
                             formatted_text = None
@@ -407,8 +436,6 @@ class EquinixMCPServer:
                                 logger.warning(
                                     f"JQ filter returned null for {operation_id}, using YAML fallback"
                                 )
-                                import yaml
-
                                 formatted_text = yaml.dump(
                                     actual_data,
                                     sort_keys=False,
@@ -423,8 +450,6 @@ class EquinixMCPServer:
                                 logger.debug(
                                     f"JQ returned non-string type {type(formatted_result)}, using YAML fallback"
                                 )
-                                import yaml
-
                                 formatted_text = yaml.dump(
                                     (
                                         formatted_result
@@ -447,8 +472,6 @@ class EquinixMCPServer:
                                     f"CRITICAL: formatted_text is {type(formatted_text)} with value {repr(formatted_text)}"
                                 )
                                 # Emergency fallback - create a simple YAML dump
-                                import yaml
-
                                 formatted_text = yaml.dump(
                                     actual_data,
                                     sort_keys=False,
@@ -605,37 +628,60 @@ class EquinixMCPServer:
         await self.initialize(force_update_specs)
         assert self.mcp is not None, "MCP server must be initialized first"
 
-        # Use stdio_server for MCP transport to avoid asyncio loop conflicts
-        await self.mcp.run_stdio_async(show_banner=True)
+        try:
+            # Use stdio_server for MCP transport to avoid asyncio loop conflicts
+            await self.mcp.run_stdio_async(show_banner=True)
+        finally:
+            # The managers keep pooled HTTP clients open between requests
+            await self.docs_manager.aclose()
+            await self.auth_manager.aclose()
 
     def _collect_defs_references(self, obj: Any) -> set[str]:
         """Collect names referenced via '#/$defs/<Name>' within a schema-like object."""
         refs: set[str] = set()
-        if isinstance(obj, dict):
-            ref = obj.get("$ref")
-            if isinstance(ref, str) and ref.startswith("#/$defs/"):
-                refs.add(ref.split("/")[-1])
-            for v in obj.values():
-                refs |= self._collect_defs_references(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                refs |= self._collect_defs_references(item)
+        # Explicit stack: deep schemas cost no recursion frames
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get("$ref")
+                if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                    refs.add(ref.split("/")[-1])
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
         return refs
 
-    def _closure_defs(self, start: set[str], defs: Dict[str, Any]) -> Dict[str, Any]:
-        """Compute transitive closure of referenced $defs starting from provided names."""
+    def _closure_defs(
+        self,
+        start: set[str],
+        defs: Dict[str, Any],
+        refs_cache: Optional[Dict[str, set[str]]] = None,
+    ) -> Dict[str, Any]:
+        """Compute transitive closure of referenced $defs starting from provided names.
+
+        ``refs_cache`` maps a def name to the names it references directly; pass
+        the same dict across calls so shared schemas are only walked once.
+        """
+        if refs_cache is None:
+            refs_cache = {}
         used = set(start)
-        changed = True
-        while changed:
-            changed = False
-            for name in list(used):
+        pending = list(start)
+        while pending:
+            name = pending.pop()
+            nested = refs_cache.get(name)
+            if nested is None:
                 schema = defs.get(name)
-                if isinstance(schema, dict):
-                    nested = self._collect_defs_references(schema)
-                    for n in nested:
-                        if n not in used:
-                            used.add(n)
-                            changed = True
+                nested = (
+                    self._collect_defs_references(schema)
+                    if isinstance(schema, dict)
+                    else set()
+                )
+                refs_cache[name] = nested
+            for n in nested:
+                if n not in used:
+                    used.add(n)
+                    pending.append(n)
         return {n: defs[n] for n in used if n in defs}
 
     async def _attach_defs_to_tool_schemas(self, merged_spec: Dict[str, Any]) -> None:
@@ -656,24 +702,22 @@ class EquinixMCPServer:
         if not isinstance(all_defs, dict) or not all_defs:
             return
 
+        # Direct references per def, shared across tools that reuse schemas
+        refs_cache: Dict[str, set[str]] = {}
+
         for tool in tools.values():
             output_schema = getattr(tool, "output_schema", None)
             if not isinstance(output_schema, dict):
                 continue
 
+            # One walk covers wrapped results too: properties.result is nested
+            # inside output_schema
             referenced = self._collect_defs_references(output_schema)
-            # If wrapped result, also inspect the inner schema
-            if output_schema.get("x-fastmcp-wrap-result") and isinstance(
-                output_schema.get("properties"), dict
-            ):
-                inner = output_schema["properties"].get("result")
-                if isinstance(inner, dict):
-                    referenced |= self._collect_defs_references(inner)
 
             if not referenced:
                 continue
 
-            subset = self._closure_defs(referenced, all_defs)
+            subset = self._closure_defs(referenced, all_defs, refs_cache)
             existing = output_schema.get("$defs")
             if isinstance(existing, dict) and existing:
                 merged = existing.copy()
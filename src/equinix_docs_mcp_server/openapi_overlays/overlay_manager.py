@@ -8,6 +8,7 @@ import aiofiles
 import yaml
 
 from equinix_docs_mcp_server.config import Config
+from equinix_docs_mcp_server.yaml_utils import FastSafeLoader, copy_document
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ class OverlayManager:
 
         async with aiofiles.open(path, "r") as f:
             content = await f.read()
-            overlay = yaml.safe_load(content)
+            overlay = yaml.load(content, Loader=FastSafeLoader)
 
         # Cache the overlay
         cache_key = str(path)
@@ -113,10 +114,8 @@ class OverlayManager:
         # In a full implementation, you'd use a proper overlay engine
 
         actions = overlay.get("actions", [])
-        # Deep copy to avoid mutating original
-        import copy as _copy
-
-        modified_spec = _copy.deepcopy(spec)
+        # Copy to avoid mutating original
+        modified_spec = copy_document(spec)
 
         def _apply_update(obj: Any, path: str, value: Any) -> None:
             """Apply a minimal JSONPath-style update, creating intermediate dicts.
@@ -1,15 +1,31 @@
 """Response formatting utilities using JQ transformations and YAML serialization."""
 
+import functools
 import json
 import logging
+import re
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
 from .config import Config
 
+try:  # Optional; response formatting is disabled without it
+    import jq  # type: ignore
+except ImportError:  # pragma: no cover
+    jq = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+_NON_NAME_CHARS = re.compile(r"[^a-z0-9_]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_name(name: str) -> str:
+    """Lowercase, turn hyphens into underscores and collapse other non-alnum runs."""
+    s = name.lower().replace("-", "_")
+    return _NON_NAME_CHARS.sub("_", s)
+
 
 class ResponseFormatter:
     """Formats API responses using JQ transformations and serializes as YAML."""
@@ -18,32 +34,40 @@ class ResponseFormatter:
         self.config = config
         self.jq_cache: Dict[str, Any] = {}
         self._current_operation_id: Optional[str] = None
+        self._format_config_cache: Dict[
+            str, Optional[Union[str, List[str], Dict[str, str]]]
+        ] = {}
 
     def set_operation_context(self, operation_id: Optional[str]) -> None:
         """Set the current operation context for formatting decisions."""
         self._current_operation_id = operation_id
 
     def _get_jq_program(self, jq_filter: str) -> Any:
-        """Get compiled JQ program from cache or compile it."""
+        """Get compiled JQ program from cache or compile it.
+
+        Failures are cached as None so a bad filter is only compiled and
+        reported once.
+        """
         if jq_filter in self.jq_cache:
             return self.jq_cache[jq_filter]
 
-        try:
-            import jq
-
-            program = jq.compile(jq_filter)
-            self.jq_cache[jq_filter] = program
-            return program
-        except ImportError:
+        program = None
+        if jq is None:
             logger.warning("JQ library not available, response formatting disabled")
-            return None
-        except Exception as e:
-            logger.error(f"Failed to compile JQ filter '{jq_filter}': {e}")
-            return None
+        else:
+            try:
+                program = jq.compile(jq_filter)
+            except Exception as e:
+                logger.error(f"Failed to compile JQ filter '{jq_filter}': {e}")
+
+        self.jq_cache[jq_filter] = program
+        return program
 
     def _apply_jq_filters(self, data: Any, filters: List[str]) -> Any:
         """Apply a list of JQ filters in sequence."""
         result = data
+        # Previews below repr() the whole payload; skip them unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
         logger.debug(
             f"Starting JQ transformation with {len(filters)} filters, input type: {type(data)}"
         )
@@ -58,9 +82,10 @@ class ResponseFormatter:
 
                 # Apply the JQ transformation using the correct API
                 jq_result = program.input(result).all()
-                logger.debug(
-                    f"JQ raw result type: {type(jq_result)}, value: {repr(jq_result)[:200] if jq_result else 'None'}"
-                )
+                if debug:
+                    logger.debug(
+                        f"JQ raw result type: {type(jq_result)}, value: {repr(jq_result)[:200] if jq_result else 'None'}"
+                    )
 
                 # JQ returns a list of results, get the first one if single result
                 if isinstance(jq_result, list) and len(jq_result) == 1:
@@ -70,9 +95,10 @@ class ResponseFormatter:
                     result = jq_result
                     logger.debug(f"Using raw result: {type(result)}")
 
-                logger.debug(
-                    f"After filter {i+1}, result type: {type(result)}, value: {repr(result)[:200] if result else 'None'}"
-                )
+                if debug:
+                    logger.debug(
+                        f"After filter {i+1}, result type: {type(result)}, value: {repr(result)[:200] if result else 'None'}"
+                    )
 
             except Exception as e:
                 logger.error(f"JQ transformation failed with filter '{jq_filter}': {e}")
@@ -80,15 +106,30 @@ class ResponseFormatter:
                 # Continue with the current result if transformation fails
                 continue
 
-        logger.debug(
-            f"Final JQ result type: {type(result)}, value: {repr(result)[:200] if result else 'None'}"
-        )
+        if debug:
+            logger.debug(
+                f"Final JQ result type: {type(result)}, value: {repr(result)[:200] if result else 'None'}"
+            )
         return result
 
     def _get_format_config(
         self, operation_id: str
     ) -> Optional[Union[str, List[str], Dict[str, str]]]:
-        """Get format configuration for an operation ID."""
+        """Get format configuration for an operation ID.
+
+        The result, including "no format", is cached per operation ID since
+        the config does not change while the server runs.
+        """
+        if operation_id in self._format_config_cache:
+            return self._format_config_cache[operation_id]
+        fmt = self._lookup_format_config(operation_id)
+        self._format_config_cache[operation_id] = fmt
+        return fmt
+
+    def _lookup_format_config(
+        self, operation_id: str
+    ) -> Optional[Union[str, List[str], Dict[str, str]]]:
+        """Find the format configuration for an operation ID in the config."""
         # Operation IDs generated from OpenAPI tools are typically prefixed
         # with the API name, e.g. "metal_findMetros" or "fabric_searchConnections".
         # However, some prefixes may contain hyphens ("network-edge") or be
@@ -116,18 +157,10 @@ class ResponseFormatter:
         # Normalize operation prefix for reliable matching: take the part before sep
         prefix = operation_id.split(sep, 1)[0]
 
-        def normalize_name(name: str) -> str:
-            # Lowercase, replace hyphens with underscores, collapse non-alnum to underscore
-            import re
-
-            s = name.lower().replace("-", "_")
-            s = re.sub(r"[^a-z0-9_]+", "_", s)
-            return s
-
-        norm_prefix = normalize_name(prefix)
+        norm_prefix = _normalize_name(prefix)
 
         for candidate in self.config.get_api_names():
-            norm_candidate = normalize_name(candidate)
+            norm_candidate = _normalize_name(candidate)
 
             # Direct match
             if norm_prefix == norm_candidate:
@@ -142,7 +175,7 @@ class ResponseFormatter:
 
             # Try last token of candidate (e.g., network-edge -> edge)
             parts = candidate.replace("_", "-").split("-")
-            if parts and normalize_name(parts[-1]) == norm_prefix:
+            if parts and _normalize_name(parts[-1]) == norm_prefix:
                 api_config = self.config.get_api_config(candidate)
                 break
 
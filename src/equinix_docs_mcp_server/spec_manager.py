@@ -9,8 +9,10 @@ specification.
 import asyncio
 import collections.abc
 import logging
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 
 import httpx
 import yaml
@@ -19,6 +21,7 @@ from openapi_spec_validator import validate
 from .config import APIConfig, Config
 from .openapi_overlays.overlay_manager import OverlayManager
 from .swagger2openapi.converter import Swagger2OpenAPIConverter
+from .yaml_utils import FastSafeLoader
 
 logger = logging.getLogger(__name__)
 
@@ -92,8 +95,6 @@ class SpecManager:
             if "servers" in spec and spec["servers"]:
                 server_url = spec["servers"][0].get("url", "")
                 if server_url:
-                    from urllib.parse import urlparse
-
                     parsed_url = urlparse(server_url)
                     base_path = parsed_url.path
                     # remove trailing slash if present
@@ -232,7 +233,7 @@ class SpecManager:
                 overlay_path = Path(spec_source.overlay)
                 if overlay_path.exists():
                     with open(overlay_path, "r") as f:
-                        overlay = yaml.safe_load(f)
+                        overlay = yaml.load(f, Loader=FastSafeLoader)
                         spec = self.overlay_manager.apply(
                             spec, api_config.name, overlay
                         )
@@ -467,7 +468,7 @@ class SpecManager:
         path = self.get_merged_spec_path(api_name)
         if path.exists():
             with open(path, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=FastSafeLoader)
         return None
 
     def get_cached_spec_path(self, spec_key: str) -> Path:
@@ -487,7 +488,7 @@ class SpecManager:
         if path.exists():
             logger.warning(f"Using cached spec for {spec_key} from {path}")
             with open(path, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=FastSafeLoader)
         logger.error(f"No cached spec found for {spec_key}")
         return None
 
@@ -508,7 +509,9 @@ class SpecManager:
         if not api_config or (not api_config.include and not api_config.exclude):
             return paths
 
-        import re
+        # Compile once per API instead of per operation
+        include = [re.compile(p, re.IGNORECASE) for p in api_config.include or []]
+        exclude = [re.compile(p, re.IGNORECASE) for p in api_config.exclude or []]
 
         filtered_paths = {}
 
@@ -525,24 +528,12 @@ class SpecManager:
                 operation_id = operation["operationId"]
 
                 # Check include patterns (if any)
-                if api_config.include:
-                    included = False
-                    for pattern in api_config.include:
-                        if re.search(pattern, operation_id, re.IGNORECASE):
-                            included = True
-                            break
-                    if not included:
-                        continue
+                if include and not any(p.search(operation_id) for p in include):
+                    continue
 
                 # Check exclude patterns (if any)
-                if api_config.exclude:
-                    excluded = False
-                    for pattern in api_config.exclude:
-                        if re.search(pattern, operation_id, re.IGNORECASE):
-                            excluded = True
-                            break
-                    if excluded:
-                        continue
+                if exclude and any(p.search(operation_id) for p in exclude):
+                    continue
 
                 # Operation passed all filters
                 filtered_path_item[method] = operation
@@ -0,0 +1,22 @@
+"""Helpers for loading and copying parsed YAML/JSON documents."""
+
+from typing import Any
+
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as FastSafeLoader  # type: ignore
+
+
+def copy_document(obj: Any) -> Any:
+    """Copy a parsed YAML/JSON document.
+
+    Parsed documents only hold dicts, lists and immutable scalars, so
+    rebuilding the containers is enough and much cheaper than
+    copy.deepcopy's memo tracking.
+    """
+    if isinstance(obj, dict):
+        return {k: copy_document(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [copy_document(v) for v in obj]
+    return obj
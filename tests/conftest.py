@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from equinix_docs_mcp_server.config import Config
+
 
 @pytest.fixture(scope="session", autouse=True)
 def test_environment():
@@ -21,6 +23,12 @@ def test_environment():
     os.chdir(original_cwd)
 
 
+@pytest.fixture(scope="session")
+def config(test_environment):
+    """Load the repo configuration once; tests only read it."""
+    return Config.load("config/apis.yaml")
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
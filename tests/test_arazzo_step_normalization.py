@@ -1,4 +1,5 @@
 import asyncio
+import copy
 from types import SimpleNamespace
 
 import pytest
@@ -22,6 +23,25 @@ workflows:
 """
 
 
+def _normalize_simple_spec(doc):
+    """Apply the normalization the arazzo manager does to simplified steps."""
+    for workflow in doc.get("workflows", {}).values():
+        for step in workflow.get("steps", []):
+            # Normalize id -> stepId
+            if "stepId" not in step and "id" in step:
+                step["stepId"] = step.pop("id")
+            # Normalize operation -> operationId
+            if "operation" in step and not any(
+                k in step for k in ("operationId", "operationPath")
+            ):
+                step["operationId"] = step.pop("operation")
+    return doc
+
+
+# Parsed and normalized once; runners get their own copy
+_NORMALIZED_SIMPLE_SPEC = _normalize_simple_spec(yaml.safe_load(SIMPLE_SPEC))
+
+
 class DummyStepExecutor:
     def __init__(self):
         self.calls = []
@@ -48,20 +68,7 @@ async def test_simplified_step_normalization(tmp_path, monkeypatch):
     # Force runner creation with dummy runner by monkeypatching _get_runner return
     class DummyRunner:
         def __init__(self):
-            self.arazzo_doc = yaml.safe_load(SIMPLE_SPEC)
-            # Simulate normalization that would be done by arazzo manager
-            workflows = self.arazzo_doc.get("workflows", {})
-            for workflow_key, workflow in workflows.items():
-                if "steps" in workflow:
-                    for step in workflow["steps"]:
-                        # Normalize id -> stepId
-                        if "stepId" not in step and "id" in step:
-                            step["stepId"] = step.pop("id")
-                        # Normalize operation -> operationId
-                        if "operation" in step and not any(
-                            k in step for k in ("operationId", "operationPath")
-                        ):
-                            step["operationId"] = step.pop("operation")
+            self.arazzo_doc = copy.deepcopy(_NORMALIZED_SIMPLE_SPEC)
             self.step_executor = DummyStepExecutor()
             self.execution_states = {}
 
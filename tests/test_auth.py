@@ -6,13 +6,6 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from equinix_docs_mcp_server.auth import AuthManager
-from equinix_docs_mcp_server.config import Config
-
-
-@pytest.fixture
-def config():
-    """Load test configuration."""
-    return Config.load("config/apis.yaml")
 
 
 @pytest.fixture
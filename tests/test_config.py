@@ -1,5 +1,6 @@
 """Test configuration loading and validation."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -7,20 +8,16 @@ import pytest
 from equinix_docs_mcp_server.config import APIConfig, Config
 
 
-def test_config_loading():
+def test_config_loading(config):
     """Test loading configuration from YAML file."""
-    config = Config.load("config/apis.yaml")
-
     assert config is not None
     assert len(config.apis) > 0
     assert "metal" in config.apis
     assert "fabric" in config.apis
 
 
-def test_api_config_structure():
+def test_api_config_structure(config):
     """Test API configuration structure."""
-    config = Config.load("config/apis.yaml")
-
     metal_config = config.get_api_config("metal")
     assert metal_config is not None
     assert metal_config.service_name == "metal"
@@ -32,10 +29,8 @@ def test_api_config_structure():
     assert fabric_config.auth_type == "client_credentials"
 
 
-def test_config_api_names():
+def test_config_api_names(config):
     """Test getting API names."""
-    config = Config.load("config/apis.yaml")
-
     api_names = config.get_api_names()
     assert isinstance(api_names, list)
     assert "metal" in api_names
@@ -44,10 +39,8 @@ def test_config_api_names():
     # assert "network-edge" in api_names
 
 
-def test_config_save_load_roundtrip(tmp_path):
+def test_config_save_load_roundtrip(config, tmp_path):
     """Test saving and loading configuration."""
-    config = Config.load("config/apis.yaml")
-
     # Save to temporary file
     temp_config_path = tmp_path / "test_config.yaml"
     config.save(str(temp_config_path))
@@ -58,3 +51,30 @@ def test_config_save_load_roundtrip(tmp_path):
     # Compare
     assert loaded_config.get_api_names() == config.get_api_names()
     assert loaded_config.auth.client_credentials == config.auth.client_credentials
+
+
+def test_config_load_reuses_parse_until_file_changes(tmp_path):
+    """Test repeated loads share one YAML parse and pick up edits."""
+    config_path = tmp_path / "apis.yaml"
+    config_path.write_text("apis:\n  metal:\n    service_name: metal\n")
+
+    first = Config.load(str(config_path))
+    first.apis["metal"].include.append("findPlans")
+    second = Config.load(str(config_path))
+
+    # Cached data is copied, so mutating one Config does not leak into the next
+    assert second.apis["metal"].include == []
+    assert second is not first
+
+    config_path.write_text("apis:\n  fabric:\n    service_name: fabric\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert Config.load(str(config_path)).get_api_names() == ["fabric"]
+
+    # A rewrite with an unchanged mtime is still seen when the size differs
+    mtime_ns = config_path.stat().st_mtime_ns
+    config_path.write_text("apis:\n  billing:\n    service_name: billing-api\n")
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    assert Config.load(str(config_path)).get_api_names() == ["billing"]
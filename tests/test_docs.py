@@ -1,27 +1,40 @@
 """Test documentation manager functionality."""
 
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
 
-from equinix_docs_mcp_server.config import Config
+from equinix_docs_mcp_server.config import Config, DocsConfig
 from equinix_docs_mcp_server.docs import DocsManager
 
 
-@pytest.fixture
-def config():
-    """Load test configuration."""
-    return Config.load("config/apis.yaml")
-
-
 @pytest.fixture
 def docs_manager(config):
     """Create docs manager instance."""
     return DocsManager(config)
 
 
+def _serve(docs_manager, handler):
+    """Route the manager's HTTP client to an in-process handler.
+
+    Returns the list of requested URLs, appended to as requests are made.
+    """
+    requested = []
+
+    def record(request):
+        requested.append(str(request.url))
+        return handler(request)
+
+    docs_manager._http._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(record)
+    )
+    return requested
+
+
 def test_docs_manager_init(docs_manager):
     """Test DocsManager initialization."""
     assert docs_manager is not None
@@ -77,8 +90,7 @@ def test_categorize_url(docs_manager):
     assert category == "General"
 
 
-@pytest.mark.asyncio
-async def test_parse_sitemap(docs_manager):
+def test_parse_sitemap(docs_manager):
     """Test sitemap parsing."""
     sample_sitemap = """<?xml version="1.0" encoding="UTF-8"?>
     <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
@@ -94,7 +106,7 @@ async def test_parse_sitemap(docs_manager):
         </url>
     </urlset>"""
 
-    await docs_manager._parse_sitemap(sample_sitemap)
+    docs_manager._parse_sitemap(sample_sitemap)
 
     assert len(docs_manager.sitemap_cache) == 2
 
@@ -109,6 +121,55 @@ async def test_parse_sitemap(docs_manager):
     assert second_doc["category"] == "Fabric"
 
 
+@pytest.mark.asyncio
+async def test_cached_sitemap_reuses_parsed_sidecar(tmp_path):
+    """Test the parsed sitemap is reused until the cached XML changes."""
+    cache_path = tmp_path / "sitemap.xml"
+    cache_path.write_text(
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://docs.equinix.com/metal/overview</loc></url>"
+        "</urlset>"
+    )
+    config = Config(docs=DocsConfig(cache_path=str(cache_path)))
+
+    first = DocsManager(config)
+    await first._load_cached_sitemap()
+    assert (tmp_path / "sitemap.xml.json").exists()
+
+    # A fresh manager loads the sidecar instead of parsing the XML again
+    second = DocsManager(config)
+    with patch.object(second, "_parse_sitemap", side_effect=AssertionError):
+        await second._load_cached_sitemap()
+    assert second.sitemap_cache == first.sitemap_cache
+    assert second.sitemap_cache[0]["category"] is first.sitemap_cache[0]["category"]
+
+    # Rewriting the XML invalidates the sidecar
+    cache_path.write_text(
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://docs.equinix.com/fabric/overview</loc></url>"
+        "<url><loc>https://docs.equinix.com/billing/overview</loc></url>"
+        "</urlset>"
+    )
+    third = DocsManager(config)
+    await third._load_cached_sitemap()
+    assert [doc["category"] for doc in third.sitemap_cache] == ["Fabric", "Billing"]
+
+    # A sidecar with a matching source but malformed entries is re-parsed
+    sidecar_path = tmp_path / "sitemap.xml.json"
+    sidecar = json.loads(sidecar_path.read_text())
+    for entries in (
+        [{"url": "https://docs.equinix.com/fabric/overview"}],
+        [{"category": "Metal"}],
+        [dict(third.sitemap_cache[0], title=None)],
+        {"url": "https://docs.equinix.com/fabric/overview"},
+    ):
+        sidecar["entries"] = entries
+        sidecar_path.write_text(json.dumps(sidecar))
+        fourth = DocsManager(config)
+        await fourth._load_cached_sitemap()
+        assert fourth.sitemap_cache == third.sitemap_cache
+
+
 @pytest.mark.asyncio
 async def test_list_docs_with_filter(docs_manager):
     """Test listing docs with filtering."""
@@ -168,41 +229,34 @@ async def test_find_docs(docs_manager):
     result = await docs_manager.find_docs("nonexistent")
     assert "No documentation found" in result
 
+    # Search keys are kept beside the entries, which stay as assigned
+    assert set(docs_manager.sitemap_cache[0]) == {"url", "title", "category", "lastmod"}
 
-@pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-@patch("equinix_docs_mcp_server.docs.aiofiles.open")
-@patch("equinix_docs_mcp_server.docs.Path.exists")
-async def test_search_docs(mock_exists, mock_aiofiles, mock_httpx, docs_manager):
-    """Test documentation search using lunr search."""
-    # Mock the cache file doesn't exist initially
-    mock_exists.return_value = False
-
-    # Mock HTTP response
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = AsyncMock()
-    mock_response.text = "[]"  # Empty search index for test
+    # Assigning a new list rebuilds the search keys
+    docs_manager.sitemap_cache = [
+        dict(docs_manager.sitemap_cache[1], title="Fabric Ports")
+    ]
+    assert "Fabric Ports" in await docs_manager.find_docs("ports")
 
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
 
-    # Mock file operations
-    mock_file = AsyncMock()
-    mock_aiofiles.return_value.__aenter__ = AsyncMock(return_value=mock_file)
+@pytest.mark.asyncio
+async def test_search_docs(docs_manager, tmp_path, monkeypatch):
+    """Test documentation search using lunr search."""
+    # Run in an empty directory so the search index cache does not exist yet
+    monkeypatch.chdir(tmp_path)
+    # Empty search index for test
+    requested = _serve(docs_manager, lambda request: httpx.Response(200, content=b"[]"))
 
-    # Test search - should attempt to fetch and cache the index
+    # Test search - should fetch and cache the index
     result = await docs_manager.search_docs("metal")
 
-    # Should have attempted to fetch the search index
-    mock_client.get.assert_called_once_with(
-        "https://docs.equinix.com/search-index.json"
-    )
+    # Should have fetched the search index once and stored it whole
+    assert requested == ["https://docs.equinix.com/search-index.json"]
+    cache_file = tmp_path / "cache" / "search" / "search-index.json"
+    assert cache_file.read_bytes() == b"[]"
+    assert not cache_file.with_name("search-index.json.tmp").exists()
 
-    # Should contain error message about search results
-    assert (
-        "No search results found" in result or "Error searching documentation" in result
-    )
+    assert "No search results found" in result
 
 
 @pytest.mark.asyncio
@@ -221,28 +275,30 @@ async def test_get_docs_summary(docs_manager):
     assert "Metal**: 2" in result
     assert "Fabric**: 1" in result
 
+    # Counts follow a newly assigned cache
+    docs_manager.sitemap_cache = docs_manager.sitemap_cache[:1]
+    result = await docs_manager.get_docs_summary()
+    assert "Metal**: 1" in result
+    assert "Fabric" not in result
+
 
 @pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-async def test_fetch_doc_success(mock_httpx, docs_manager):
+async def test_fetch_doc_success(docs_manager):
     """Test successful document fetching."""
-    # Mock HTTP response
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = AsyncMock()
-    mock_response.text = "# Test Document\n\nThis is test content."
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_httpx.return_value.__aexit__ = AsyncMock()
+    requested = _serve(
+        docs_manager,
+        lambda request: httpx.Response(
+            200, text="# Test Document\n\nThis is test content."
+        ),
+    )
 
     # Test with full URL without .md extension
-    result = await docs_manager.fetch_doc("https://docs.equinix.com/metal/getting-started")
+    result = await docs_manager.fetch_doc(
+        "https://docs.equinix.com/metal/getting-started"
+    )
 
-    # Should have called with .md extension
-    mock_client.get.assert_called_once()
-    call_args = mock_client.get.call_args
-    assert call_args[0][0] == "https://docs.equinix.com/metal/getting-started.md"
+    # Should have requested the .md version
+    assert requested == ["https://docs.equinix.com/metal/getting-started.md"]
 
     # Should return the content
     assert "# Test Document" in result
@@ -250,69 +306,40 @@ async def test_fetch_doc_success(mock_httpx, docs_manager):
 
 
 @pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-async def test_fetch_doc_with_md_extension(mock_httpx, docs_manager):
+async def test_fetch_doc_with_md_extension(docs_manager):
     """Test fetching a document that already has .md extension."""
-    # Mock HTTP response
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = AsyncMock()
-    mock_response.text = "# Another Test\n\nContent here."
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_httpx.return_value.__aexit__ = AsyncMock()
+    requested = _serve(
+        docs_manager,
+        lambda request: httpx.Response(200, text="# Another Test\n\nContent here."),
+    )
 
     # Test with URL that already has .md extension
     result = await docs_manager.fetch_doc("https://docs.equinix.com/fabric/overview.md")
 
     # Should not double the .md extension
-    mock_client.get.assert_called_once()
-    call_args = mock_client.get.call_args
-    assert call_args[0][0] == "https://docs.equinix.com/fabric/overview.md"
+    assert requested == ["https://docs.equinix.com/fabric/overview.md"]
 
     assert "# Another Test" in result
 
 
 @pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-async def test_fetch_doc_relative_url(mock_httpx, docs_manager):
+async def test_fetch_doc_relative_url(docs_manager):
     """Test fetching with a relative URL."""
-    # Mock HTTP response
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = AsyncMock()
-    mock_response.text = "# Relative URL Test"
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_httpx.return_value.__aexit__ = AsyncMock()
+    requested = _serve(
+        docs_manager, lambda request: httpx.Response(200, text="# Relative URL Test")
+    )
 
     # Test with relative URL
-    result = await docs_manager.fetch_doc("metal/api-reference")
+    await docs_manager.fetch_doc("metal/api-reference")
 
     # Should prepend https://docs.equinix.com/ and add .md
-    mock_client.get.assert_called_once()
-    call_args = mock_client.get.call_args
-    assert call_args[0][0] == "https://docs.equinix.com/metal/api-reference.md"
+    assert requested == ["https://docs.equinix.com/metal/api-reference.md"]
 
 
 @pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-async def test_fetch_doc_http_error(mock_httpx, docs_manager):
+async def test_fetch_doc_http_error(docs_manager):
     """Test handling of HTTP errors when fetching documents."""
-    # Mock HTTP error response
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_error = httpx.HTTPStatusError(
-        "Not Found", request=AsyncMock(), response=mock_response
-    )
-    mock_response.raise_for_status = AsyncMock(side_effect=mock_error)
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_httpx.return_value.__aexit__ = AsyncMock()
+    _serve(docs_manager, lambda request: httpx.Response(404, text="Not Found"))
 
     result = await docs_manager.fetch_doc("https://docs.equinix.com/nonexistent")
 
@@ -323,17 +350,59 @@ async def test_fetch_doc_http_error(mock_httpx, docs_manager):
 
 
 @pytest.mark.asyncio
-@patch("equinix_docs_mcp_server.docs.httpx.AsyncClient")
-async def test_fetch_doc_request_error(mock_httpx, docs_manager):
+async def test_fetch_doc_request_error(docs_manager):
     """Test handling of request errors when fetching documents."""
-    # Mock request error
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
-    mock_httpx.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_httpx.return_value.__aexit__ = AsyncMock()
+
+    def handler(request):
+        raise httpx.ConnectError("Connection failed", request=request)
+
+    _serve(docs_manager, handler)
 
     result = await docs_manager.fetch_doc("https://docs.equinix.com/test")
 
     # Should return error message
     assert "Error fetching document" in result
     assert "Connection failed" in result
+
+
+@pytest.mark.asyncio
+async def test_fetch_doc_caches_by_normalized_url(docs_manager):
+    """Equivalent URLs share one fetch until the cache is invalidated."""
+    requested = _serve(
+        docs_manager, lambda request: httpx.Response(200, text="# Cached")
+    )
+
+    assert await docs_manager.fetch_doc("metal/overview") == "# Cached"
+    assert (
+        await docs_manager.fetch_doc("https://docs.equinix.com/metal/overview.md")
+        == "# Cached"
+    )
+    assert len(requested) == 1
+
+    docs_manager.invalidate()
+    await docs_manager.fetch_doc("metal/overview/")
+    assert len(requested) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_docs_fetches_concurrently_in_order(docs_manager):
+    """Batch fetches run concurrently and keep the input order."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=str(request.url))
+
+    requested = _serve(docs_manager, handler)
+
+    urls = [f"metal/page-{i}" for i in range(20)]
+    results = await docs_manager.fetch_docs(urls)
+
+    assert results == [f"https://docs.equinix.com/{url}.md" for url in urls]
+    assert len(requested) == 20
+    assert 1 < peak <= 16
@@ -0,0 +1,25 @@
+"""Test the shared lazy HTTP client helper."""
+
+import httpx
+import pytest
+
+from equinix_docs_mcp_server.http_client import LazyAsyncClient
+
+
+@pytest.mark.asyncio
+async def test_client_created_once_and_released_on_aclose():
+    """The pooled client is created on first use and dropped on aclose()."""
+    http = LazyAsyncClient(timeout=5.0)
+    assert http._client is None
+
+    client = http.client
+    assert http.client is client
+    assert client.timeout == httpx.Timeout(5.0)
+
+    await http.aclose()
+    assert client.is_closed
+    assert http._client is None
+
+    # A later request gets a fresh client
+    assert http.client is not client
+    await http.aclose()
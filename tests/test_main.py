@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,39 +11,38 @@ from equinix_docs_mcp_server.config import Config
 from equinix_docs_mcp_server.main import AuthenticatedClient, EquinixMCPServer
 
 
+async def _noop(*args, **kwargs):
+    """Awaitable stand-in for coroutine methods whose result is unused."""
+    return None
+
+
+async def _empty_tools(*args, **kwargs):
+    """Awaitable stand-in for FastMCP.get_tools with no tools."""
+    return {}
+
+
+@pytest.fixture(scope="class")
+def client():
+    """Build one client per class; service detection is stateless."""
+    return AuthenticatedClient(SimpleNamespace(), SimpleNamespace())
+
+
 class TestAuthenticatedClient:
     """Test the AuthenticatedClient wrapper."""
 
-    def test_get_service_from_url(self):
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://api.equinix.com/metal/v1/projects", "metal"),
+            ("https://api.equinix.com/fabric/v4/connections", "fabric"),
+            ("https://api.equinix.com/network-edge/api/v1/devices", "network-edge"),
+            ("https://api.equinix.com/billing/v1/invoices", "billing"),
+            ("https://api.equinix.com/other/v1/something", "unknown"),
+        ],
+    )
+    def test_get_service_from_url(self, client, url, expected):
         """Test service detection from URL."""
-        auth_manager = MagicMock()
-        response_formatter = MagicMock()
-        client = AuthenticatedClient(auth_manager, response_formatter)
-
-        assert (
-            client._get_service_from_url("https://api.equinix.com/metal/v1/projects")
-            == "metal"
-        )
-        assert (
-            client._get_service_from_url(
-                "https://api.equinix.com/fabric/v4/connections"
-            )
-            == "fabric"
-        )
-        assert (
-            client._get_service_from_url(
-                "https://api.equinix.com/network-edge/api/v1/devices"
-            )
-            == "network-edge"
-        )
-        assert (
-            client._get_service_from_url("https://api.equinix.com/billing/v1/invoices")
-            == "billing"
-        )
-        assert (
-            client._get_service_from_url("https://api.equinix.com/other/v1/something")
-            == "unknown"
-        )
+        assert client._get_service_from_url(url) == expected
 
 
 class TestEquinixMCPServer:
@@ -82,7 +82,8 @@ class TestEquinixMCPServer:
             mock_config_load.return_value = mock_config
 
             mock_spec_instance = MagicMock()
-            mock_spec_instance.update_specs = AsyncMock()
+            # MagicMock records the call; the side effect supplies the awaitable
+            mock_spec_instance.update_specs = MagicMock(side_effect=_noop)
             mock_spec_instance.has_all_cached_specs = MagicMock(return_value=False)
             mock_spec_instance.get_merged_spec = MagicMock(
                 return_value={
@@ -93,15 +94,13 @@ class TestEquinixMCPServer:
             )
             mock_spec_mgr.return_value = mock_spec_instance
 
-            mock_auth_instance = MagicMock()
-            mock_auth_mgr.return_value = mock_auth_instance
-
-            mock_docs_instance = MagicMock()
-            mock_docs_mgr.return_value = mock_docs_instance
+            # Placeholders only: initialize() passes these along without using them
+            mock_auth_mgr.return_value = SimpleNamespace()
+            mock_docs_mgr.return_value = SimpleNamespace()
 
             mock_mcp = MagicMock()
             mock_mcp.tool = MagicMock()
-            mock_mcp.get_tools = AsyncMock(return_value={})
+            mock_mcp.get_tools = _empty_tools
 
             # Create a different mock for the main FastMCP instance
             mock_main_mcp = MagicMock()
@@ -135,3 +134,71 @@ class TestEquinixMCPServer:
             mock_spec_instance.get_merged_spec.assert_called_once()
 
             assert server.mcp == mock_main_mcp
+
+    @pytest.mark.asyncio
+    async def test_concurrent_initialize_runs_once(self):
+        """Test concurrent initialize() calls share one run, retried on failure."""
+        with patch("equinix_docs_mcp_server.config.Config.load"):
+            server = EquinixMCPServer("test_config.yaml")
+
+        calls = []
+
+        async def fake_initialize(force_update_specs):
+            calls.append(force_update_specs)
+            await asyncio.sleep(0)
+            if len(calls) == 1:
+                raise RuntimeError("spec fetch failed")
+
+        with patch.object(server, "_initialize", side_effect=fake_initialize):
+            with pytest.raises(RuntimeError):
+                await asyncio.gather(server.initialize(), server.initialize())
+            assert calls == [False]
+
+            await asyncio.gather(server.initialize(), server.initialize())
+            await server.initialize()
+            assert calls == [False, False]
+
+            await server.initialize(force_update_specs=True)
+            assert calls == [False, False, True]
+
+    def test_closure_defs_reuses_refs_cache(self):
+        """Test $defs closure follows nested refs and fills the shared cache."""
+        with patch("equinix_docs_mcp_server.config.Config.load"):
+            server = EquinixMCPServer("test_config.yaml")
+
+        defs = {
+            "Project": {"properties": {"meta": {"$ref": "#/$defs/Meta"}}},
+            "Meta": {"properties": {"href": {"$ref": "#/$defs/Href"}}},
+            "Href": {"type": "string"},
+            "Unused": {"type": "object"},
+        }
+        refs_cache: dict = {}
+
+        subset = server._closure_defs({"Project"}, defs, refs_cache)
+
+        assert set(subset) == {"Project", "Meta", "Href"}
+        assert refs_cache == {"Project": {"Meta"}, "Meta": {"Href"}, "Href": set()}
+
+        # Cached entries are used instead of re-walking the schemas
+        refs_cache["Href"] = {"Unused"}
+        subset = server._closure_defs({"Meta"}, defs, refs_cache)
+        assert set(subset) == {"Meta", "Href", "Unused"}
+
+    @pytest.mark.asyncio
+    async def test_run_closes_http_clients(self):
+        """Test run() closes the managers' HTTP clients even when serving fails."""
+        with patch("equinix_docs_mcp_server.config.Config.load"):
+            server = EquinixMCPServer("test_config.yaml")
+        server.mcp = MagicMock()
+        server.mcp.run_stdio_async = AsyncMock(side_effect=RuntimeError("closed"))
+
+        with patch.object(server, "initialize", side_effect=_noop), patch.object(
+            server.docs_manager, "aclose", side_effect=_noop
+        ) as docs_aclose, patch.object(
+            server.auth_manager, "aclose", side_effect=_noop
+        ) as auth_aclose:
+            with pytest.raises(RuntimeError):
+                await server.run()
+
+        docs_aclose.assert_called_once()
+        auth_aclose.assert_called_once()
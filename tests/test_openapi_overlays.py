@@ -1,26 +1,43 @@
 """Test OpenAPI overlay functionality."""
 
+import copy
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from equinix_docs_mcp_server.config import Config
 from equinix_docs_mcp_server.openapi_overlays import OverlayManager
 
+_OVERLAY_BYTES = b"""
+overlay: "1.0.0"
+info:
+  title: "Test Overlay"
+  version: "1.0.0"
+actions:
+  - target: "$.info.title"
+    update: "Updated Title"
+"""
 
-@pytest.fixture
-def config():
-    """Load test configuration."""
-    return Config.load("config/apis.yaml")
 
+@pytest.fixture(scope="module")
+def overlay_dir(tmp_path_factory):
+    """One scratch directory for the module; tests use distinct file names."""
+    return tmp_path_factory.mktemp("overlays")
 
-@pytest.fixture
-def overlay_manager(config):
-    """Create overlay manager instance."""
+
+@pytest.fixture(scope="module")
+def _shared_overlay_manager(config):
+    """Create one overlay manager for the module."""
     return OverlayManager(config)
 
 
+@pytest.fixture
+def overlay_manager(_shared_overlay_manager):
+    """Hand each test the shared manager, emptying its cache afterwards."""
+    yield _shared_overlay_manager
+    _shared_overlay_manager.clear_cache()
+
+
 def test_overlay_manager_init(overlay_manager):
     """Test OverlayManager initialization."""
     assert overlay_manager is not None
@@ -28,9 +45,9 @@ def test_overlay_manager_init(overlay_manager):
 
 
 @pytest.mark.asyncio
-async def test_load_overlay_nonexistent(overlay_manager, tmp_path):
+async def test_load_overlay_nonexistent(overlay_manager, overlay_dir):
     """Test loading a non-existent overlay file."""
-    overlay_path = tmp_path / "nonexistent.yaml"
+    overlay_path = overlay_dir / "nonexistent.yaml"
 
     result = await overlay_manager.load_overlay(str(overlay_path))
 
@@ -39,21 +56,12 @@ async def test_load_overlay_nonexistent(overlay_manager, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_load_overlay_existing(overlay_manager, tmp_path):
+async def test_load_overlay_existing(overlay_manager, overlay_dir):
     """Test loading an existing overlay file."""
-    overlay_path = tmp_path / "test_overlay.yaml"
+    overlay_path = overlay_dir / "test_overlay.yaml"
 
     # Create a test overlay file
-    overlay_content = """
-overlay: "1.0.0"
-info:
-  title: "Test Overlay"
-  version: "1.0.0"
-actions:
-  - target: "$.info.title"
-    update: "Updated Title"
-"""
-    overlay_path.write_text(overlay_content)
+    overlay_path.write_bytes(_OVERLAY_BYTES)
 
     result = await overlay_manager.load_overlay(str(overlay_path))
 
@@ -64,87 +72,104 @@ actions:
 
 
 @pytest.mark.asyncio
-async def test_create_overlay_template_basic(overlay_manager, tmp_path):
+async def test_create_overlay_template_basic(overlay_manager, overlay_dir):
     """Test creating a basic overlay template."""
-    overlay_path = tmp_path / "basic_overlay.yaml"
+    overlay_path = overlay_dir / "basic_overlay.yaml"
 
     await overlay_manager.create_overlay_template(str(overlay_path), "fabric", "fabric")
 
     assert overlay_path.exists()
 
     # Load and verify content
-    content = overlay_path.read_text()
-    assert "overlay: 1.0.0" in content
-    assert "Equinix Fabric API" in content
-    assert "https://api.equinix.com" in content
+    content = overlay_path.read_bytes()
+    assert b"overlay: 1.0.0" in content
+    assert b"Equinix Fabric API" in content
+    assert b"https://api.equinix.com" in content
 
 
 @pytest.mark.asyncio
-async def test_create_overlay_template_metal(overlay_manager, tmp_path):
+async def test_create_overlay_template_metal(overlay_manager, overlay_dir):
     """Test creating overlay template for Metal API with special handling."""
-    overlay_path = tmp_path / "metal_overlay.yaml"
+    overlay_path = overlay_dir / "metal_overlay.yaml"
 
     await overlay_manager.create_overlay_template(str(overlay_path), "metal", "metal")
 
     assert overlay_path.exists()
 
     # Load and verify content
-    content = overlay_path.read_text()
-    assert "overlay: 1.0.0" in content
-    assert "Equinix Metal API" in content
-
-
-def test_apply_overlay_simple(overlay_manager):
-    """Test applying a simple overlay to a spec."""
-    spec = {
-        "info": {"title": "Original Title", "version": "1.0.0"},
-        "servers": [{"url": "https://old.example.com"}],
-        "paths": {},
-    }
-
-    overlay = {
-        "actions": [
-            {"target": "$.info.title", "update": "New Title"},
-            {"target": "$.servers", "update": [{"url": "https://new.example.com"}]},
-        ]
-    }
+    content = overlay_path.read_bytes()
+    assert b"overlay: 1.0.0" in content
+    assert b"Equinix Metal API" in content
+
+
+_SPEC_TEMPLATE = {
+    "info": {"title": "Original Title", "version": "1.0.0"},
+    "servers": [{"url": "https://old.example.com"}],
+    "paths": {},
+}
+
+
+@pytest.mark.parametrize(
+    "spec_tmpl,overlay,expected",
+    [
+        pytest.param(
+            _SPEC_TEMPLATE,
+            {
+                "actions": [
+                    {"target": "$.info.title", "update": "New Title"},
+                    {
+                        "target": "$.servers",
+                        "update": [{"url": "https://new.example.com"}],
+                    },
+                ]
+            },
+            {
+                # version and paths are unchanged
+                "info": {"title": "New Title", "version": "1.0.0"},
+                "servers": [{"url": "https://new.example.com"}],
+                "paths": {},
+            },
+            id="simple",
+        ),
+        pytest.param(
+            _SPEC_TEMPLATE,
+            {"actions": []},
+            _SPEC_TEMPLATE,
+            id="no_actions",
+        ),
+        pytest.param(
+            {"paths": {}},  # No info section
+            {"actions": [{"target": "$.info.title", "update": "New Title"}]},
+            # The missing intermediate node is created and the value set
+            {"paths": {}, "info": {"title": "New Title"}},
+            id="missing_target",
+        ),
+    ],
+)
+def test_apply_overlay(overlay_manager, spec_tmpl, overlay, expected):
+    """Test applying overlays to a spec."""
+    spec = copy.deepcopy(spec_tmpl)
 
     result = overlay_manager.apply(spec, "test", overlay)
 
-    assert result["info"]["title"] == "New Title"
-    assert result["info"]["version"] == "1.0.0"  # Unchanged
-    assert result["servers"] == [{"url": "https://new.example.com"}]
-    assert "paths" in result  # Unchanged
+    assert result == expected
 
 
-def test_apply_overlay_no_actions(overlay_manager):
-    """Test applying an overlay with no actions."""
+def test_apply_overlay_does_not_mutate_input(overlay_manager):
+    """Test applying an overlay leaves the input spec untouched."""
     spec = {
         "info": {"title": "Original Title"},
-        "servers": [{"url": "https://example.com"}],
+        "paths": {"/items": {"get": {"operationId": "listItems"}}},
     }
 
-    overlay = {"actions": []}
-
-    result = overlay_manager.apply(spec, "test", overlay)
-
-    # Should be unchanged
-    assert result["info"]["title"] == "Original Title"
-    assert result["servers"] == [{"url": "https://example.com"}]
-
-
-def test_apply_overlay_missing_target(overlay_manager):
-    """Test applying an overlay to a spec that doesn't have the target."""
-    spec = {"paths": {}}  # No info section
-
-    overlay = {"actions": [{"target": "$.info.title", "update": "New Title"}]}
+    overlay = {"actions": [{"target": "$.info", "update": {"title": "New Title"}}]}
 
     result = overlay_manager.apply(spec, "test", overlay)
+    result["paths"]["/items"]["get"]["operationId"] = "api_listItems"
 
-    # Should create the missing intermediate node and set the value
-    assert "info" in result
     assert result["info"]["title"] == "New Title"
-    assert "paths" in result
+    assert spec["info"]["title"] == "Original Title"
+    assert spec["paths"]["/items"]["get"]["operationId"] == "listItems"
 
 
 def test_get_cached_overlay(overlay_manager):
@@ -1,11 +1,9 @@
-import sys
-from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-# Ensure repo "src" is on path when running tests directly
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
+from equinix_docs_mcp_server import response_formatter
 from equinix_docs_mcp_server.config import APIConfig, Config
 from equinix_docs_mcp_server.response_formatter import ResponseFormatter
 
@@ -35,3 +33,26 @@ def test_network_edge_get_metros_format_lookup():
         assert fmt is not None, f"Formatter did not find format for operation id: {op}"
         # We set the fake format as a list above
         assert isinstance(fmt, list), f"Expected list-format for {op}, got {type(fmt)}"
+
+    # Repeat lookups are served from the formatter's cache without rescanning
+    # the configured API names
+    first = rf._get_format_config(candidates[0])
+    with patch.object(Config, "get_api_names", side_effect=AssertionError):
+        for op in candidates:
+            assert rf._get_format_config(op) is first
+
+
+def test_jq_compile_failures_are_cached(monkeypatch):
+    """A filter that fails to compile is only compiled once."""
+    calls = []
+
+    def fake_compile(jq_filter):
+        calls.append(jq_filter)
+        raise ValueError("bad filter")
+
+    monkeypatch.setattr(response_formatter, "jq", SimpleNamespace(compile=fake_compile))
+    rf = ResponseFormatter(Config(apis={}))
+
+    assert rf._get_jq_program(".[") is None
+    assert rf._get_jq_program(".[") is None
+    assert calls == [".["]